@@ -15,33 +15,40 @@ const requestSchema = z.object({
   focusArea: z.enum(['general', 'technology', 'business', 'healthcare', 'finance']).optional().default('general')
 })
 
+// Compiled once at module load instead of per request; /g flags dropped since
+// a shared global regex keeps lastIndex state between tests
+const maliciousPatterns = [
+  /<script\b[^<]*(?:(?!<\/script>)<[^<]*)*<\/script>/i,
+  /javascript:/i,
+  /on\w+\s*=/i,
+  /(ignore\s+(previous|all)\s+(instructions?|prompts?|rules?))/i,
+  /(system\s*:?\s*(override|ignore|forget|disregard))/i,
+  /(jailbreak|prompt\s*injection|role\s*play\s*as)/i
+]
+
 // Security: Check for malicious content in queries
 function containsMaliciousContent(input: string): boolean {
-  const maliciousPatterns = [
-    /<script\b[^<]*(?:(?!<\/script>)<[^<]*)*<\/script>/gi,
-    /javascript:/gi,
-    /on\w+\s*=/gi,
-    /(ignore\s+(previous|all)\s+(instructions?|prompts?|rules?))/gi,
-    /(system\s*:?\s*(override|ignore|forget|disregard))/gi,
-    /(jailbreak|prompt\s*injection|role\s*play\s*as)/gi
-  ]
-  
   return maliciousPatterns.some(pattern => pattern.test(input))
 }
 
+// Static prompt scaffolding, built once at module load rather than per request
+const focusInstructions = {
+  technology: 'Focus on technical innovations, market trends, key players, and future developments.',
+  business: 'Focus on market analysis, competitive landscape, financial metrics, and strategic insights.',
+  healthcare: 'Focus on medical developments, clinical research, regulatory changes, and patient outcomes.',
+  finance: 'Focus on market conditions, investment opportunities, risk factors, and economic indicators.',
+  general: 'Provide comprehensive analysis across all relevant domains.'
+} as const
+
+const formatInstructionsByFormat = {
+  json: 'Format your response as valid JSON with fields: summary, key_findings, analysis, recommendations, sources.',
+  text: 'Format your response as clear, structured text with headers and bullet points.'
+} as const
+
 // Build comprehensive research prompt based on query and parameters
 function buildResearchPrompt(query: string, outputFormat: string, sourceLimit: number, focusArea: string): string {
-  const focusInstructions = {
-    technology: 'Focus on technical innovations, market trends, key players, and future developments.',
-    business: 'Focus on market analysis, competitive landscape, financial metrics, and strategic insights.',
-    healthcare: 'Focus on medical developments, clinical research, regulatory changes, and patient outcomes.',
-    finance: 'Focus on market conditions, investment opportunities, risk factors, and economic indicators.',
-    general: 'Provide comprehensive analysis across all relevant domains.'
-  }
-
-  const formatInstructions = outputFormat === 'json' 
-    ? 'Format your response as valid JSON with fields: summary, key_findings, analysis, recommendations, sources.'
-    : 'Format your response as clear, structured text with headers and bullet points.'
+  const formatInstructions = formatInstructionsByFormat[outputFormat as keyof typeof formatInstructionsByFormat]
+    || formatInstructionsByFormat.text
 
   return `You are an expert research analyst. Conduct comprehensive research on: "${query}"
 
@@ -195,9 +202,11 @@ export async function POST(req: Request) {
         data: { status: 'PROCESSING' }
       })
 
-      // Log usage for analytics
+      // Log usage for analytics - fire-and-forget so the database write and
+      // Sentry round trip never sit between the model and the client; the
+      // logger swallows its own failures
       const duration = Date.now() - startTime
-      await logUsage({
+      void logUsage({
         userId,
         endpoint: '/api/research',
         method: 'POST',
@@ -213,7 +222,7 @@ export async function POST(req: Request) {
       })
 
       // Log performance metrics
-      await logPerformance({
+      void logPerformance({
         endpoint: '/api/research',
         userId,
         duration,
@@ -1,69 +1,101 @@
 """
 Async Research Example
-Demonstrates asynchronous research queries with webhook notifications
+Demonstrates concurrent research queries with webhook notifications
 """
 
-from nsai import NSAIClient
+from nsai import AsyncNSAIClient
+import asyncio
 import os
-import time
+import random
 
-client = NSAIClient(api_key=os.getenv("NSAI_API_KEY"))
+try:
+    # Optional faster event loop on Linux/macOS (pip install nsai[perf]);
+    # Windows falls back to asyncio's default loop
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
 
-def main():
-    # Start multiple research queries asynchronously
+async def main():
+    # Start multiple research queries concurrently
     queries = [
         "Latest developments in renewable energy technology",
         "Impact of AI on healthcare diagnostics",
         "Future of electric vehicle batteries"
     ]
-    
-    research_ids = []
-    
-    print("🚀 Starting multiple research queries...\n")
-    
-    for query in queries:
-        response = client.research(
-            query=query,
-            max_sources=10,
-            webhook_url="https://your-webhook-endpoint.com/nsai-webhook"  # Optional
-        )
-        research_ids.append(response.research_id)
-        print(f"📋 Started research: {query}")
-        print(f"   ID: {response.research_id}")
-    
-    print("\n⏳ Monitoring research progress...\n")
-    
-    # Poll for completion
-    completed = set()
-    while len(completed) < len(research_ids):
-        for research_id in research_ids:
-            if research_id in completed:
-                continue
-                
-            status = client.get_research_status(research_id)
-            
-            if status.status == "completed":
-                completed.add(research_id)
-                print(f"✅ Research {research_id} completed!")
-                
-                # Fetch full results
-                history = client.get_research_history(limit=1)
-                for query in history["queries"]:
-                    if query["research_id"] == research_id:
-                        print(f"   Topic: {queries[research_ids.index(research_id)]}")
+
+    async with AsyncNSAIClient(api_key=os.getenv("NSAI_API_KEY")) as client:
+        print("🚀 Starting multiple research queries...\n")
+
+        # Submit all queries in one gather - they share the client's
+        # connection pool instead of paying one round-trip per query.
+        # In production, prefer webhook delivery over polling: host an
+        # endpoint at webhook_url and the API will POST the finished result
+        # there, so the status loop below is only needed as a fallback.
+        responses = await asyncio.gather(*[
+            client.research(
+                query=query,
+                max_sources=10,
+                webhook_url="https://your-webhook-endpoint.com/nsai-webhook"  # Optional
+            )
+            for query in queries
+        ])
+
+        research_ids = [response.research_id for response in responses]
+        topic_by_id = dict(zip(research_ids, queries))
+        for query, response in zip(queries, responses):
+            print(f"📋 Started research: {query}")
+            print(f"   ID: {response.research_id}")
+
+        print("\n⏳ Monitoring research progress...\n")
+
+        # Poll for completion, checking all pending queries concurrently.
+        # The interval backs off while nothing changes and resets as soon as
+        # a query finishes, so we neither hammer the API early nor add
+        # seconds of latency once results start arriving.
+        interval = 0.5
+        max_interval = 10.0
+        completed = set()
+        while len(completed) < len(research_ids):
+            prev_completed_count = len(completed)
+            pending = [rid for rid in research_ids if rid not in completed]
+            # One batched request covers every pending query
+            statuses = await client.get_research_statuses(pending)
+
+            newly_completed = []
+            for status in statuses.values():
+                research_id = status.research_id
+
+                if status.status == "completed":
+                    completed.add(research_id)
+                    newly_completed.append(research_id)
+                    print(f"✅ Research {research_id} completed!")
+                elif status.status == "failed":
+                    completed.add(research_id)
+                    print(f"❌ Research {research_id} failed")
+                else:
+                    print(f"🔄 Research {research_id}: {status.status} - {status.progress}%")
+
+            if newly_completed:
+                # One history fetch covers every query that just finished;
+                # index it by ID so each lookup is O(1)
+                history = await client.get_research_history(limit=len(research_ids))
+                by_id = {q["research_id"]: q for q in history["queries"]}
+                for research_id in newly_completed:
+                    query = by_id.get(research_id)
+                    if query:
+                        print(f"   Topic: {topic_by_id[research_id]}")
                         print(f"   Duration: {query['duration_ms']}ms")
-                        break
-                        
-            elif status.status == "failed":
-                completed.add(research_id)
-                print(f"❌ Research {research_id} failed")
-            else:
-                print(f"🔄 Research {research_id}: {status.status} - {status.progress}%")
-        
-        if len(completed) < len(research_ids):
-            time.sleep(2)  # Wait before next check
-    
+
+            if len(completed) < len(research_ids):
+                if len(completed) == prev_completed_count:
+                    interval = min(max_interval, interval * 1.5)
+                else:
+                    interval = 0.5
+                # +/-20% jitter keeps many pollers from synchronizing
+                await asyncio.sleep(interval * random.uniform(0.8, 1.2))
+
     print("\n🎉 All research queries completed!")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    asyncio.run(main())
@@ -12,6 +12,23 @@ export const ResearchQuerySchema = z.object({
 
 export type ResearchQuery = z.infer<typeof ResearchQuerySchema>
 
+// Shared OpenAI client - agents are constructed per request, so a per-instance
+// client would discard the HTTP keep-alive pool and redo TLS handshakes on
+// every agent's first call
+let sharedOpenAIClient: OpenAI | null = null
+
+function getOpenAIClient(): OpenAI {
+  if (!sharedOpenAIClient) {
+    if (!process.env.OPENAI_API_KEY) {
+      throw new Error('OPENAI_API_KEY environment variable is required')
+    }
+    sharedOpenAIClient = new OpenAI({
+      apiKey: process.env.OPENAI_API_KEY,
+    })
+  }
+  return sharedOpenAIClient
+}
+
 export interface ResearchResult {
   content: string
   metadata: {
@@ -30,14 +47,7 @@ export class AIResearchAgent {
   private model: string
 
   constructor() {
-    if (!process.env.OPENAI_API_KEY) {
-      throw new Error('OPENAI_API_KEY environment variable is required')
-    }
-    
-    this.openai = new OpenAI({
-      apiKey: process.env.OPENAI_API_KEY,
-    })
-    
+    this.openai = getOpenAIClient()
     this.model = process.env.OPENAI_MODEL || 'gpt-4o'
   }
 
@@ -45,20 +55,19 @@ export class AIResearchAgent {
    * Main research method that orchestrates the multi-step research process
    */
   async performResearch(query: ResearchQuery): Promise<ResearchResult> {
-    const startTime = Date.now()
+    // Monotonic clock - reported durations should not jump with NTP adjustments
+    const startTime = performance.now()
     const processingSteps: string[] = []
     let totalTokens = 0
 
     try {
-      // Step 1: Analyze and structure the query
+      // Steps 1+2: Analyze the query and derive the structured research plan in a
+      // single LLM round trip - the analysis text never has to be re-sent
       processingSteps.push('Query Analysis')
-      const researchPlan = await this.analyzeQuery(query.query, query.focusArea)
-      totalTokens += researchPlan.tokensUsed
-
-      // Step 2: Generate structured research plan
       processingSteps.push('Research Planning')
-      const structuredQueries = await this.createResearchPlan(query.query, researchPlan.analysis, query.focusArea)
-      totalTokens += structuredQueries.tokensUsed
+      const researchPlan = await this.analyzeAndPlanQuery(query.query, query.focusArea)
+      totalTokens += researchPlan.tokensUsed
+      const structuredQueries = { queries: researchPlan.queries }
 
       // Step 3: Perform research on each component
       processingSteps.push('Multi-Agent Research')
@@ -75,7 +84,7 @@ export class AIResearchAgent {
       )
       totalTokens += finalReport.tokensUsed
 
-      const duration = Date.now() - startTime
+      const duration = Math.round(performance.now() - startTime)
 
       return {
         content: finalReport.content,
@@ -96,88 +105,63 @@ export class AIResearchAgent {
   }
 
   /**
-   * Step 1: Analyze the user query and understand intent
+   * Steps 1+2: Analyze the user query and build the structured research plan
+   * in one call - previously two sequential completions where the second
+   * re-sent the full analysis text as prompt context
    */
-  private async analyzeQuery(query: string, focusArea: string): Promise<{ analysis: string, tokensUsed: number }> {
-    const prompt = `As an expert research analyst, analyze this query and provide a comprehensive research framework.
+  private async analyzeAndPlanQuery(
+    query: string,
+    focusArea: string
+  ): Promise<{ analysis: string, queries: string[], tokensUsed: number }> {
+    const prompt = `As an expert research analyst, analyze this query and build a research plan for it.
 
 Query: "${query}"
 Focus Area: ${focusArea}
 
-Provide:
+First, write a comprehensive research framework covering:
 1. Key research questions to answer
 2. Important subtopics to explore
 3. Types of sources needed (academic, industry, news, reports)
 4. Potential challenges or limitations
 5. Expected scope and depth of research
 
-Be specific and actionable. This will guide our multi-agent research process.`
-
-    const response = await this.openai.chat.completions.create({
-      model: this.model,
-      messages: [
-        {
-          role: 'system',
-          content: 'You are an expert research analyst who creates comprehensive research frameworks for complex queries.'
-        },
-        { role: 'user', content: prompt }
-      ],
-      temperature: 0.3,
-      max_tokens: 1000
-    })
-
-    return {
-      analysis: response.choices[0]?.message?.content || 'Analysis failed',
-      tokensUsed: response.usage?.total_tokens || 0
-    }
-  }
-
-  /**
-   * Step 2: Create structured research plan based on analysis
-   */
-  private async createResearchPlan(
-    originalQuery: string, 
-    analysis: string, 
-    focusArea: string
-  ): Promise<{ queries: string[], tokensUsed: number }> {
-    const prompt = `Based on this research analysis, create 3-5 specific, focused research queries that will comprehensively address the original question.
-
-Original Query: "${originalQuery}"
-Research Analysis: ${analysis}
-Focus Area: ${focusArea}
-
-Create specific sub-queries that cover:
+Then, based on that framework, create 3-5 specific, focused research queries that
+comprehensively address the original question, covering:
 - Current state and trends
-- Key players and competitive landscape  
+- Key players and competitive landscape
 - Future projections and opportunities
 - Challenges and risks
 - Practical implications
 
-Format as a JSON array of strings. Each query should be specific and researchable.`
+Respond with valid JSON of the shape:
+{"analysis": "<the research framework>", "queries": ["<sub-query>", ...]}`
 
     const response = await this.openai.chat.completions.create({
       model: this.model,
       messages: [
         {
           role: 'system',
-          content: 'You are a research strategist who breaks down complex topics into specific, actionable research queries. Always respond with valid JSON.'
+          content: 'You are an expert research analyst who creates comprehensive research frameworks and breaks them into specific, actionable research queries. Always respond with valid JSON.'
         },
         { role: 'user', content: prompt }
       ],
-      temperature: 0.2,
-      max_tokens: 500
+      temperature: 0.3,
+      max_tokens: 1500,
+      response_format: { type: 'json_object' }
     })
 
-    let queries: string[]
+    let analysis = 'Analysis failed'
+    let queries: string[] = [query]
     try {
-      const content = response.choices[0]?.message?.content || '[]'
-      queries = JSON.parse(content)
+      const parsed = JSON.parse(response.choices[0]?.message?.content || '{}')
+      if (typeof parsed.analysis === 'string') analysis = parsed.analysis
+      if (Array.isArray(parsed.queries) && parsed.queries.length > 0) queries = parsed.queries
     } catch {
-      // Fallback to original query if parsing fails
-      queries = [originalQuery]
+      // Fall back to researching the original query directly
     }
 
     return {
+      analysis,
       queries,
       tokensUsed: response.usage?.total_tokens || 0
     }
@@ -188,15 +172,19 @@ Format as a JSON array of strings. Each query should be specific and researchabl
    * In production, this would integrate with real data sources
    */
   private async executeResearchPlan(
-    queries: string[], 
+    queries: string[],
     maxSources: number
   ): Promise<{ findings: string[], sourcesCount: number, tokensUsed: number }> {
     const findings: string[] = []
     let totalTokens = 0
     let sourcesCount = 0
 
-    for (const query of queries.slice(0, 3)) { // Limit to 3 queries for performance
-      const researchPrompt = `Conduct comprehensive research on: "${query}"
+    // Research queries are independent, so dispatch them concurrently instead of
+    // awaiting each completion in turn - total latency becomes the slowest call
+    // rather than the sum of all calls
+    const responses = await Promise.allSettled(
+      queries.slice(0, 3).map(query => { // Limit to 3 queries for performance
+        const researchPrompt = `Conduct comprehensive research on: "${query}"
 
 Provide detailed findings including:
 - Current state and key statistics
@@ -207,19 +195,27 @@ Provide detailed findings including:
 
 Focus on factual, actionable insights with specific data points where possible.`
 
-      const response = await this.openai.chat.completions.create({
-        model: this.model,
-        messages: [
-          {
-            role: 'system',
-            content: 'You are an expert researcher with access to comprehensive databases. Provide detailed, fact-based research with specific data points and insights.'
-          },
-          { role: 'user', content: researchPrompt }
-        ],
-        temperature: 0.4,
-        max_tokens: 1500
+        return this.openai.chat.completions.create({
+          model: this.model,
+          messages: [
+            {
+              role: 'system',
+              content: 'You are an expert researcher with access to comprehensive databases. Provide detailed, fact-based research with specific data points and insights.'
+            },
+            { role: 'user', content: researchPrompt }
+          ],
+          temperature: 0.4,
+          max_tokens: 1500
+        })
       })
+    )
 
+    for (const settled of responses) {
+      if (settled.status === 'rejected') {
+        console.warn('Research query failed:', settled.reason)
+        continue
+      }
+      const response = settled.value
       const finding = response.choices[0]?.message?.content || 'No findings available'
       findings.push(finding)
       totalTokens += response.usage?.total_tokens || 0
@@ -1,3 +1,4 @@
+import crypto from 'crypto'
 import { z } from 'zod'
 
 // Rate limiting configurations per plan
@@ -33,33 +34,36 @@ export const QueryValidationSchema = z.object({
   stream: z.boolean().default(false)
 })
 
+// Compiled once at module load - this runs on every incoming query, and
+// rebuilding the array allocated a dozen fresh RegExp objects per call.
+// No /g flags: a shared global regex carries lastIndex state between tests.
+const maliciousPatterns = [
+  // Script injection attempts
+  /<script\b[^<]*(?:(?!<\/script>)<[^<]*)*<\/script>/i,
+  /javascript:/i,
+  /on\w+\s*=/i,
+
+  // SQL injection patterns
+  /(\b(SELECT|INSERT|UPDATE|DELETE|DROP|CREATE|ALTER|EXEC|UNION)\b)/i,
+  /(;|\|\||&&|\/\*|\*\/|--)/,
+
+  // Command injection
+  /(\||\;|\&|\`|\$\(|\$\{)/,
+
+  // Path traversal
+  /(\.\.\/|\.\.\\)/,
+
+  // XSS patterns
+  /(<iframe|<object|<embed|<applet|<meta)/i,
+
+  // Prompt injection patterns for AI
+  /(ignore\s+(previous|all)\s+(instructions?|prompts?|rules?))/i,
+  /(system\s*:?\s*(override|ignore|forget|disregard))/i,
+  /(jailbreak|prompt\s*injection|role\s*play\s*as)/i
+]
+
 // Security: Check for malicious content in queries
 export function containsMaliciousContent(input: string): boolean {
-  const maliciousPatterns = [
-    // Script injection attempts
-    /<script\b[^<]*(?:(?!<\/script>)<[^<]*)*<\/script>/gi,
-    /javascript:/gi,
-    /on\w+\s*=/gi,
-    
-    // SQL injection patterns
-    /(\b(SELECT|INSERT|UPDATE|DELETE|DROP|CREATE|ALTER|EXEC|UNION)\b)/gi,
-    /(;|\|\||&&|\/\*|\*\/|--)/g,
-    
-    // Command injection
-    /(\||\;|\&|\`|\$\(|\$\{)/g,
-    
-    // Path traversal
-    /(\.\.\/|\.\.\\)/g,
-    
-    // XSS patterns
-    /(<iframe|<object|<embed|<applet|<meta)/gi,
-    
-    // Prompt injection patterns for AI
-    /(ignore\s+(previous|all)\s+(instructions?|prompts?|rules?))/gi,
-    /(system\s*:?\s*(override|ignore|forget|disregard))/gi,
-    /(jailbreak|prompt\s*injection|role\s*play\s*as)/gi
-  ]
-  
   return maliciousPatterns.some(pattern => pattern.test(input))
 }
 
@@ -166,7 +170,6 @@ export function generateRequestFingerprint(
   userAgent: string,
   query: string
 ): string {
-  const crypto = require('crypto')
   const data = `${ip}:${userAgent}:${query.substring(0, 100)}`
   return crypto.createHash('sha256').update(data).digest('hex').substring(0, 16)
 }
@@ -1,7 +1,15 @@
 import bcrypt from 'bcryptjs'
+import crypto from 'crypto'
 import { prisma } from '@/lib/prisma'
 import { z } from 'zod'
 
+// API keys are bearer secrets, so generate them from the CSPRNG rather than
+// relying on the schema's cuid() default (timestamp/counter based, guessable).
+// The prefix makes keys identifiable in logs and support tickets.
+export function generateApiKey(): string {
+  return `nsai_${crypto.randomBytes(24).toString('base64url')}`
+}
+
 export const registerSchema = z.object({
   email: z.string().email('Invalid email address'),
   password: z.string()
@@ -24,6 +32,7 @@ export async function createUser(data: RegisterInput) {
         email: data.email,
         password: hashedPassword,
         name: data.name,
+        apiKey: generateApiKey(),
       },
       select: {
         id: true,
@@ -98,6 +98,33 @@ class EliteCacheService {
     }
   }
 
+  /**
+   * Atomically increment a counter key, creating it with the given TTL.
+   * Redis INCR is atomic so concurrent callers never lose updates; falls
+   * back to the memory cache when Redis is unavailable.
+   */
+  async increment(key: string, config?: CacheConfig): Promise<number> {
+    const ttl = config?.ttl || 300000 // 5 minutes default
+
+    if (this.redisClient) {
+      try {
+        const count = await this.redisClient.incr(key)
+        if (count === 1) {
+          await this.redisClient.pExpire(key, ttl)
+        }
+        // Keep the memory tier in sync for fast reads
+        this.memoryCache.set(key, count, { ttl })
+        return count
+      } catch (error) {
+        console.warn(`Redis incr error for key ${key}:`, error)
+      }
+    }
+
+    const next = ((this.memoryCache.get(key) as number) || 0) + 1
+    this.memoryCache.set(key, next, { ttl })
+    return next
+  }
+
   /**
    * Delete from all cache tiers
    */
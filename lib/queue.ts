@@ -440,16 +440,27 @@ class JobQueue {
     // Handle streaming response
     if (response.headers.get('content-type')?.includes('text/stream')) {
       const reader = response.body?.getReader()
+      // One stateful decoder for the whole stream - constructing a decoder per
+      // chunk also mangles multi-byte characters split across chunk boundaries
+      const decoder = new TextDecoder()
+      const maxResultBytes = 4 * 1024 * 1024 // Cap buffered result at 4MB
+      let receivedBytes = 0
       let result = ''
-      
+
       if (reader) {
         while (true) {
           const { done, value } = await reader.read()
           if (done) break
-          result += new TextDecoder().decode(value)
+          receivedBytes += value.byteLength
+          if (receivedBytes > maxResultBytes) {
+            await reader.cancel()
+            throw new Error(`Research result exceeded ${maxResultBytes} byte limit`)
+          }
+          result += decoder.decode(value, { stream: true })
         }
+        result += decoder.decode()
       }
-      
+
       return { content: result, format: job.outputFormat }
     }
 
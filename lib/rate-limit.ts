@@ -85,8 +85,9 @@ class RateLimit {
               windowStart: now
             }
           }).catch(err => console.error('Rate limit record error:', err)),
-          // Increment cache counter
-          cache.set(cacheKey, recentRequests + 1, { ttl: window })
+          // Atomic counter increment - a read-modify-write here would lose
+          // updates when concurrent requests race on the same window
+          cache.increment(cacheKey, { ttl: window })
         ])
       }
 
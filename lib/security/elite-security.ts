@@ -197,6 +197,21 @@ export function verifyHash(data: string, hashedData: string): boolean {
   )
 }
 
+// Membership structures for the per-request security checks, frozen once at
+// module load: the blocklist env var never changes within a process and the
+// bot patterns are constant
+const blockedIps = new Set(process.env.BLOCKED_IPS?.split(',') || [])
+
+const botPatterns = [
+  /bot/i,
+  /crawler/i,
+  /spider/i,
+  /scraper/i,
+  /curl/i,
+  /wget/i,
+  /python-requests/i
+]
+
 // IP-based security checks
 export async function performSecurityChecks(request: Request): Promise<{
   passed: boolean
@@ -212,22 +227,11 @@ export async function performSecurityChecks(request: Request): Promise<{
   }
   
   // Check for known bad IPs (would use external service in production)
-  const badIps = process.env.BLOCKED_IPS?.split(',') || []
-  if (badIps.includes(ip)) {
+  if (blockedIps.has(ip)) {
     return { passed: false, reason: 'blocked_ip' }
   }
-  
+
   // Check for bot patterns
-  const botPatterns = [
-    /bot/i,
-    /crawler/i,
-    /spider/i,
-    /scraper/i,
-    /curl/i,
-    /wget/i,
-    /python-requests/i
-  ]
-  
   const isBot = botPatterns.some(pattern => pattern.test(userAgent))
   if (isBot && !userAgent.includes('Googlebot')) {
     return { 
@@ -3,13 +3,19 @@ NSAI Data Python SDK
 Official Python client for NSAI Data - Enterprise Autonomous Research Platform
 """
 
-from .client import NSAIClient
+from typing import TYPE_CHECKING
+
 from .models import ResearchQuery, ResearchResponse, ResearchStatus
 from .exceptions import NSAIError, AuthenticationError, RateLimitError
 from .version import __version__
 
+if TYPE_CHECKING:
+    from .client import NSAIClient
+    from .async_client import AsyncNSAIClient
+
 __all__ = [
     "NSAIClient",
+    "AsyncNSAIClient",
     "ResearchQuery",
     "ResearchResponse",
     "ResearchStatus",
@@ -17,4 +23,17 @@ __all__ = [
     "AuthenticationError",
     "RateLimitError",
     "__version__"
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    # PEP 562 lazy loading: the clients pull in httpx (and its dependency
+    # tree), which users who only need the models or exceptions shouldn't
+    # pay for at import time
+    if name == "NSAIClient":
+        from .client import NSAIClient
+        return NSAIClient
+    if name == "AsyncNSAIClient":
+        from .async_client import AsyncNSAIClient
+        return AsyncNSAIClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
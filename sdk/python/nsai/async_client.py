@@ -0,0 +1,310 @@
+"""
+NSAI Data Async Client
+Asyncio client for interacting with NSAI Data API
+"""
+
+import os
+import asyncio
+import warnings
+import httpx
+from typing import Optional, Dict, Any, List
+from .models import ResearchQuery, ResearchResponse, ResearchStatus
+from .exceptions import NSAIError, AuthenticationError, RateLimitError, NetworkError
+from .client import _prepare_json, _decode_json, _parse_retry_after
+
+
+class AsyncNSAIClient:
+    """
+    Asynchronous NSAI Data API Client
+
+    Mirrors :class:`NSAIClient` on top of ``httpx.AsyncClient`` so multiple
+    research queries can be submitted and polled concurrently over one
+    shared connection pool instead of serializing on round-trips.
+
+    Example:
+        >>> from nsai import AsyncNSAIClient
+        >>> async with AsyncNSAIClient(api_key="your-api-key") as client:
+        ...     response = await client.research("What are the latest AI developments?")
+        ...     print(response.report)
+    """
+
+    BASE_URL = "https://api.nsaidata.com/v1"
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        timeout: float = 300.0,
+        max_retries: int = 3,
+        http2: bool = False
+    ):
+        """
+        Initialize async NSAI Data client
+
+        Args:
+            api_key: Your NSAI Data API key (or set NSAI_API_KEY env var)
+            base_url: Optional custom API endpoint
+            timeout: Request timeout in seconds
+            max_retries: Maximum number of retry attempts
+            http2: Enable HTTP/2 multiplexing (requires the ``h2`` package,
+                installed via ``pip install nsai[http2]``)
+        """
+        self.api_key = api_key or os.getenv("NSAI_API_KEY")
+        if not self.api_key:
+            raise AuthenticationError(
+                "API key required. Pass api_key or set NSAI_API_KEY environment variable"
+            )
+
+        self.base_url = base_url or self.BASE_URL
+        self.timeout = timeout
+        self.max_retries = max_retries
+
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=timeout,
+            http2=http2,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            # Connect-level retries happen inside the transport, reusing the
+            # pooled connection without surfacing to the Python retry loop
+            transport=httpx.AsyncHTTPTransport(retries=max_retries),
+            headers={
+                "Authorization": f"Bearer {self.api_key}",
+                "User-Agent": "nsai-python/1.0.0",
+                "Accept": "application/json"
+            }
+        )
+
+    async def research(
+        self,
+        query: str,
+        output_format: str = "markdown",
+        max_sources: int = 10,
+        enable_validation: bool = True,
+        include_sources: bool = True,
+        webhook_url: Optional[str] = None
+    ) -> ResearchResponse:
+        """
+        Create a new research query
+
+        Args:
+            query: The research question or topic
+            output_format: Output format (markdown, json, html)
+            max_sources: Maximum number of sources to analyze
+            enable_validation: Enable fact-checking and validation
+            include_sources: Include source citations in response
+            webhook_url: Optional webhook for async notifications
+
+        Returns:
+            ResearchResponse object containing the report and metadata
+        """
+        request = ResearchQuery(
+            query=query,
+            output_format=output_format,
+            max_sources=max_sources,
+            enable_validation=enable_validation,
+            include_sources=include_sources,
+            webhook_url=webhook_url
+        )
+
+        response = await self._make_request(
+            "POST",
+            "/research/query",
+            json=request.model_dump()
+        )
+
+        return ResearchResponse(**response)
+
+    async def get_research_status(self, research_id: str) -> ResearchStatus:
+        """
+        Get the status of a research query
+
+        Args:
+            research_id: The ID of the research query
+
+        Returns:
+            ResearchStatus object
+        """
+        response = await self._make_request(
+            "GET",
+            f"/research/status/{research_id}"
+        )
+
+        return ResearchStatus(**response)
+
+    async def get_research_statuses(self, research_ids: List[str]) -> Dict[str, ResearchStatus]:
+        """
+        Get the status of several research queries in one request
+
+        Args:
+            research_ids: IDs of the research queries to check
+
+        Returns:
+            Mapping of research_id to ResearchStatus
+        """
+        response = await self._make_request(
+            "GET",
+            "/research/status",
+            params={"ids": ",".join(research_ids)}
+        )
+
+        return {s["research_id"]: ResearchStatus(**s) for s in response["statuses"]}
+
+    async def get_research_history(
+        self,
+        limit: int = 10,
+        offset: int = 0,
+        status: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Get research query history
+
+        Args:
+            limit: Number of results to return
+            offset: Pagination offset
+            status: Filter by status (pending, processing, completed, failed)
+
+        Returns:
+            Dictionary containing queries and pagination info
+        """
+        params = {
+            "limit": limit,
+            "offset": offset
+        }
+        if status:
+            params["status"] = status
+
+        return await self._make_request(
+            "GET",
+            "/research/history",
+            params=params
+        )
+
+    async def cancel_research(self, research_id: str) -> Dict[str, str]:
+        """
+        Cancel a pending or processing research query
+
+        Args:
+            research_id: The ID of the research query to cancel
+
+        Returns:
+            Confirmation message
+        """
+        return await self._make_request(
+            "POST",
+            f"/research/cancel/{research_id}"
+        )
+
+    async def get_usage(self, period: str = "current") -> Dict[str, Any]:
+        """
+        Get API usage statistics
+
+        Args:
+            period: Usage period (current, last_month, all_time)
+
+        Returns:
+            Usage statistics including queries, tokens, and costs
+        """
+        return await self._make_request(
+            "GET",
+            f"/usage/{period}"
+        )
+
+    async def create_api_key(self, name: str, scopes: List[str] = None) -> Dict[str, Any]:
+        """
+        Create a new API key
+
+        Args:
+            name: Name for the API key
+            scopes: Optional list of scopes/permissions
+
+        Returns:
+            New API key details (key is only shown once)
+        """
+        data = {"name": name}
+        if scopes:
+            data["scopes"] = scopes
+
+        return await self._make_request(
+            "POST",
+            "/api-keys",
+            json=data
+        )
+
+    async def list_api_keys(self) -> List[Dict[str, Any]]:
+        """List all API keys (excludes the actual key values)"""
+        return await self._make_request("GET", "/api-keys")
+
+    async def revoke_api_key(self, key_id: str) -> Dict[str, str]:
+        """Revoke an API key"""
+        return await self._make_request("DELETE", f"/api-keys/{key_id}")
+
+    async def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        **kwargs
+    ) -> Any:
+        """
+        Make HTTP request with retries and error handling
+
+        Connection errors are retried by the httpx transport; this loop only
+        retries responses the transport cannot, i.e. 429 and 5xx.
+        """
+        last_error = None
+        _prepare_json(kwargs)
+
+        for attempt in range(self.max_retries):
+            try:
+                response = await self._client.request(method, endpoint, **kwargs)
+
+                if response.status_code == 429:
+                    # Rate limited
+                    retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+                    if attempt < self.max_retries - 1:
+                        await asyncio.sleep(retry_after)
+                        continue
+                    raise RateLimitError(
+                        f"Rate limit exceeded. Retry after {retry_after:.0f} seconds"
+                    )
+
+                response.raise_for_status()
+                return _decode_json(response)
+
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code == 401:
+                    raise AuthenticationError("Invalid API key")
+                elif e.response.status_code == 403:
+                    raise AuthenticationError("Insufficient permissions")
+                elif e.response.status_code >= 500:
+                    last_error = e
+                    if attempt < self.max_retries - 1:
+                        await asyncio.sleep(2 ** attempt)  # Exponential backoff
+                        continue
+                else:
+                    raise NSAIError(f"API error: {e.response.text}")
+            except httpx.RequestError as e:
+                raise NetworkError(f"Network error: {e}") from e
+
+        raise NSAIError(f"Request failed after {self.max_retries} attempts: {last_error}")
+
+    async def close(self):
+        """Close the HTTP client"""
+        await self._client.aclose()
+
+    def __del__(self):
+        # No event loop is available here, so only warn; closing must happen
+        # via `async with` or an explicit `await close()`
+        client = getattr(self, "_client", None)
+        if client is not None and not client.is_closed:
+            warnings.warn(
+                "AsyncNSAIClient was never closed; use "
+                "`async with AsyncNSAIClient(...)` or await close()",
+                ResourceWarning,
+                stacklevel=2
+            )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
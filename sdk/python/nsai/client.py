@@ -5,10 +5,54 @@ Main client for interacting with NSAI Data API
 
 import os
 import time
+import warnings
 import httpx
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from typing import Optional, Dict, Any, List
 from .models import ResearchQuery, ResearchResponse, ResearchStatus
-from .exceptions import NSAIError, AuthenticationError, RateLimitError
+from .exceptions import NSAIError, AuthenticationError, RateLimitError, NetworkError
+
+try:
+    # Optional C-accelerated JSON, installed via `pip install nsai[perf]`
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _prepare_json(kwargs: Dict[str, Any]) -> None:
+    """Pre-serialize a `json=` kwarg with orjson when available"""
+    if orjson is not None and "json" in kwargs:
+        kwargs["content"] = orjson.dumps(kwargs.pop("json"))
+        kwargs.setdefault("headers", {})["Content-Type"] = "application/json"
+
+
+def _decode_json(response: "httpx.Response") -> Any:
+    """Decode a response body with orjson when available"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _parse_retry_after(value: Optional[str], cap: float = 60.0) -> float:
+    """
+    Parse a Retry-After header into seconds, capped at `cap`
+
+    RFC 9110 allows both delta-seconds ("120") and an HTTP-date
+    ("Wed, 21 Oct 2015 07:28:00 GMT"); servers use either.
+    """
+    if value is None:
+        return cap
+    try:
+        delay = float(value)
+    except ValueError:
+        try:
+            delay = (
+                parsedate_to_datetime(value) - datetime.now(timezone.utc)
+            ).total_seconds()
+        except (TypeError, ValueError):
+            return cap
+    return min(cap, max(0.0, delay))
 
 
 class NSAIClient:
@@ -29,16 +73,22 @@ class NSAIClient:
         api_key: Optional[str] = None,
         base_url: Optional[str] = None,
         timeout: float = 300.0,
-        max_retries: int = 3
+        max_retries: int = 3,
+        http2: bool = False,
+        cache_ttl: float = 5.0
     ):
         """
         Initialize NSAI Data client
-        
+
         Args:
             api_key: Your NSAI Data API key (or set NSAI_API_KEY env var)
             base_url: Optional custom API endpoint
             timeout: Request timeout in seconds
             max_retries: Maximum number of retry attempts
+            http2: Enable HTTP/2 multiplexing (requires the ``h2`` package,
+                installed via ``pip install nsai[http2]``)
+            cache_ttl: Seconds to cache idempotent reads such as history and
+                usage lookups (0 disables caching)
         """
         self.api_key = api_key or os.getenv("NSAI_API_KEY")
         if not self.api_key:
@@ -49,13 +99,25 @@ class NSAIClient:
         self.base_url = base_url or self.BASE_URL
         self.timeout = timeout
         self.max_retries = max_retries
-        
+        self.cache_ttl = cache_ttl
+        self._get_cache: Dict[Any, Any] = {}
+
         self._client = httpx.Client(
             base_url=self.base_url,
             timeout=timeout,
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=30.0
+            ),
+            # Connect-level retries happen inside the transport, reusing the
+            # pooled connection without surfacing to the Python retry loop
+            transport=httpx.HTTPTransport(retries=max_retries),
             headers={
                 "Authorization": f"Bearer {self.api_key}",
-                "User-Agent": "nsai-python/1.0.0"
+                "User-Agent": "nsai-python/1.0.0",
+                "Accept": "application/json"
             }
         )
     
@@ -103,7 +165,7 @@ class NSAIClient:
         response = self._make_request(
             "POST",
             "/research/query",
-            json=request.dict()
+            json=request.model_dump()
         )
         
         return ResearchResponse(**response)
@@ -124,7 +186,25 @@ class NSAIClient:
         )
         
         return ResearchStatus(**response)
-    
+
+    def get_research_statuses(self, research_ids: List[str]) -> Dict[str, ResearchStatus]:
+        """
+        Get the status of several research queries in one request
+
+        Args:
+            research_ids: IDs of the research queries to check
+
+        Returns:
+            Mapping of research_id to ResearchStatus
+        """
+        response = self._make_request(
+            "GET",
+            "/research/status",
+            params={"ids": ",".join(research_ids)}
+        )
+
+        return {s["research_id"]: ResearchStatus(**s) for s in response["statuses"]}
+
     def get_research_history(
         self,
         limit: int = 10,
@@ -148,12 +228,8 @@ class NSAIClient:
         }
         if status:
             params["status"] = status
-        
-        return self._make_request(
-            "GET",
-            "/research/history",
-            params=params
-        )
+
+        return self._cached_get("/research/history", params=params)
     
     def cancel_research(self, research_id: str) -> Dict[str, str]:
         """
@@ -165,6 +241,7 @@ class NSAIClient:
         Returns:
             Confirmation message
         """
+        self._get_cache.clear()
         return self._make_request(
             "POST",
             f"/research/cancel/{research_id}"
@@ -180,10 +257,7 @@ class NSAIClient:
         Returns:
             Usage statistics including queries, tokens, and costs
         """
-        return self._make_request(
-            "GET",
-            f"/usage/{period}"
-        )
+        return self._cached_get(f"/usage/{period}")
     
     def create_api_key(self, name: str, scopes: List[str] = None) -> Dict[str, Any]:
         """
@@ -199,7 +273,8 @@ class NSAIClient:
         data = {"name": name}
         if scopes:
             data["scopes"] = scopes
-            
+
+        self._get_cache.clear()
         return self._make_request(
             "POST",
             "/api-keys",
@@ -208,37 +283,69 @@ class NSAIClient:
     
     def list_api_keys(self) -> List[Dict[str, Any]]:
         """List all API keys (excludes the actual key values)"""
-        return self._make_request("GET", "/api-keys")
-    
+        return self._cached_get("/api-keys")
+
     def revoke_api_key(self, key_id: str) -> Dict[str, str]:
         """Revoke an API key"""
+        self._get_cache.clear()
         return self._make_request("DELETE", f"/api-keys/{key_id}")
-    
+
+    def _cached_get(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None
+    ) -> Any:
+        """
+        GET with a short TTL cache for idempotent read endpoints
+
+        Polling loops tend to re-request history/usage several times within
+        a couple of seconds; within `cache_ttl` the cached body is returned
+        instead of paying another round-trip. Mutating calls clear the cache.
+        """
+        if self.cache_ttl <= 0:
+            return self._make_request("GET", endpoint, params=params)
+
+        key = (endpoint, tuple(sorted(params.items())) if params else None)
+        now = time.monotonic()
+        cached = self._get_cache.get(key)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
+        value = self._make_request("GET", endpoint, params=params)
+        self._get_cache[key] = (now + self.cache_ttl, value)
+        return value
+
     def _make_request(
         self,
         method: str,
         endpoint: str,
         **kwargs
     ) -> Any:
-        """Make HTTP request with retries and error handling"""
+        """
+        Make HTTP request with retries and error handling
+
+        Connection errors are retried by the httpx transport; this loop only
+        retries responses the transport cannot, i.e. 429 and 5xx.
+        """
         last_error = None
-        
+        _prepare_json(kwargs)
+
         for attempt in range(self.max_retries):
             try:
                 response = self._client.request(method, endpoint, **kwargs)
                 
                 if response.status_code == 429:
                     # Rate limited
-                    retry_after = int(response.headers.get("Retry-After", 60))
+                    retry_after = _parse_retry_after(response.headers.get("Retry-After"))
                     if attempt < self.max_retries - 1:
                         time.sleep(retry_after)
                         continue
                     raise RateLimitError(
-                        f"Rate limit exceeded. Retry after {retry_after} seconds"
+                        f"Rate limit exceeded. Retry after {retry_after:.0f} seconds"
                     )
                 
                 response.raise_for_status()
-                return response.json()
+                return _decode_json(response)
                 
             except httpx.HTTPStatusError as e:
                 if e.response.status_code == 401:
@@ -252,18 +359,28 @@ class NSAIClient:
                         continue
                 else:
                     raise NSAIError(f"API error: {e.response.text}")
-            except Exception as e:
-                last_error = e
-                if attempt < self.max_retries - 1:
-                    time.sleep(2 ** attempt)
-                    continue
-        
+            except httpx.RequestError as e:
+                raise NetworkError(f"Network error: {e}") from e
+
         raise NSAIError(f"Request failed after {self.max_retries} attempts: {last_error}")
     
     def close(self):
         """Close the HTTP client"""
         self._client.close()
-    
+
+    def __del__(self):
+        # Pooled connections hold sockets until GC; flag clients that were
+        # never closed so long-running processes don't leak FDs silently
+        client = getattr(self, "_client", None)
+        if client is not None and not client.is_closed:
+            warnings.warn(
+                "NSAIClient was never closed; use `with NSAIClient(...)` "
+                "or call close()",
+                ResourceWarning,
+                stacklevel=2
+            )
+            client.close()
+
     def __enter__(self):
         return self
     
@@ -5,7 +5,10 @@ Data models for API requests and responses
 
 from typing import Optional, List, Dict, Any
 from datetime import datetime
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+# Built once at import; the validator runs on every ResearchQuery construction
+_ALLOWED_FORMATS = frozenset({"markdown", "json", "html"})
 
 
 class ResearchQuery(BaseModel):
@@ -16,17 +19,19 @@ class ResearchQuery(BaseModel):
     enable_validation: bool = Field(True, description="Enable fact-checking")
     include_sources: bool = Field(True, description="Include source citations")
     webhook_url: Optional[str] = Field(None, description="Webhook URL for async notifications")
-    
-    @validator("output_format")
+
+    @field_validator("output_format")
+    @classmethod
     def validate_format(cls, v):
-        allowed = ["markdown", "json", "html"]
-        if v not in allowed:
-            raise ValueError(f"output_format must be one of {allowed}")
+        if v not in _ALLOWED_FORMATS:
+            raise ValueError(f"output_format must be one of {sorted(_ALLOWED_FORMATS)}")
         return v
 
 
 class ResearchResponse(BaseModel):
     """Research query response model"""
+    model_config = ConfigDict(frozen=True)
+
     research_id: str
     status: str
     report: Optional[str] = None
@@ -57,6 +62,8 @@ class ResearchResponse(BaseModel):
 
 class ResearchStatus(BaseModel):
     """Research status model"""
+    model_config = ConfigDict(frozen=True)
+
     research_id: str
     status: str  # pending, processing, completed, failed
     progress: Optional[int] = Field(None, ge=0, le=100)
@@ -41,6 +41,13 @@ setup(
         "pydantic>=2.0.0",
     ],
     extras_require={
+        "http2": [
+            "h2>=4.0",
+        ],
+        "perf": [
+            "orjson>=3.9",
+            "uvloop>=0.19; platform_system != 'Windows'",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-asyncio>=0.21.0",